@@ -10,11 +10,186 @@ Sub-commands:
 """
 
 import os
+import csv
+import json
+import time
+import sqlite3
 import argparse
-from typing import Dict, List, Optional
+import functools
+from contextlib import closing
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from github import Github
+from github import Github, GithubRetry
+
+try:  # optional: multithreaded C CSV writer
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:  # fall back to DataFrame.to_csv
+    pa = pa_compute = pa_csv = None
+
+try:  # optional: compiled single-pass summary kernel
+    from numba import njit
+except ImportError:  # fall back to vectorized numpy
+    njit = None
+
+# Items requested per page (the API maximum)
+PER_PAGE = 100
+# Pause before the quota drops below this many requests
+RATE_LIMIT_FLOOR = 50
+# The only issue states GitHub returns
+ISSUE_STATE = pd.CategoricalDtype(["open", "closed"])
+_CLOSED_CODE = ISSUE_STATE.categories.get_loc("closed")
+# int64 value of NaT, and nanoseconds per day
+_NAT = np.datetime64("NaT").view("i8")
+_NS_PER_DAY = 86400 * 10**9
+
+
+@functools.lru_cache(maxsize=1)
+def _clients() -> Tuple[Github, ...]:
+    """
+    Shared GitHub clients, one per token in $GITHUB_TOKENS (comma-separated)
+    or just $GITHUB_TOKEN. Reusing them keeps pooled HTTPS sessions (no fresh
+    TLS handshake per fetch). Retries back off on 403/429 secondary limits,
+    honouring Retry-After.
+    """
+    tokens = os.getenv("GITHUB_TOKENS", os.getenv("GITHUB_TOKEN", ""))
+    tokens = [token.strip() for token in tokens.split(",") if token.strip()]
+    return tuple(
+        Github(token, per_page=PER_PAGE, retry=GithubRetry(total=10, backoff_factor=1))
+        for token in tokens or [None]
+    )
+
+
+def _gh() -> Github:
+    """
+    The client with the most remaining rate-limit quota, so that with N
+    tokens successive fetches spread over N x 5000 requests/hour.
+    """
+    clients = _clients()
+    if len(clients) == 1:
+        return clients[0]
+    return max(clients, key=lambda gh: gh.rate_limiting[0])
+
+
+def _wait_for_rate_limit(gh: Github, floor: int = RATE_LIMIT_FLOOR) -> None:
+    """
+    Sleep until the rate-limit window resets when the remaining quota
+    (taken from the X-RateLimit-* headers of the last response) is low.
+    """
+    remaining, _limit = gh.rate_limiting
+    if remaining >= floor:
+        return
+    delay = gh.rate_limiting_resettime - time.time()
+    if delay > 0:
+        time.sleep(delay + 1)
+
+
+def _json_default(value: object) -> str:
+    """
+    JSON encoder fallback for cached payloads: datetimes as ISO-8601.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _conditional_fetch(gh: Github, cache_path: Optional[str], key: str,
+                       probe_url: str, probe_params: Dict[str, object],
+                       fetch: Callable[[], object]) -> object:
+    """
+    Return the payload cached under `key` in the sqlite file `cache_path`
+    when a conditional GET of `probe_url` (If-None-Match with the stored
+    ETag) answers 304 Not Modified; otherwise call `fetch()` and store
+    its result with the new ETag. 304 responses do not count against the
+    rate limit. With no `cache_path`, this is just `fetch()`.
+
+    The payload is stored as JSON (datetimes as ISO-8601 strings, which the
+    caller parses back), so loading a cache file never executes code.
+    """
+    if cache_path is None:
+        return fetch()
+
+    with closing(sqlite3.connect(cache_path)) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS json_pages (key TEXT PRIMARY KEY, etag TEXT, payload TEXT)"
+        )
+        row = conn.execute("SELECT etag, payload FROM json_pages WHERE key = ?", (key,)).fetchone()
+
+        headers = {"If-None-Match": row[0]} if row and row[0] else {}
+        status, response_headers, _ = gh.requester.requestJson(
+            "GET", probe_url, parameters=probe_params, headers=headers
+        )
+        if status == 304 and row is not None:
+            return json.loads(row[1])
+
+        payload = fetch()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO json_pages (key, etag, payload) VALUES (?, ?, ?)",
+                (key, response_headers.get("etag"), json.dumps(payload, default=_json_default)),
+            )
+    return payload
+
+
+def _epoch_ns(column: pd.Series) -> np.ndarray:
+    """
+    View a date column as int64 nanoseconds since the epoch (UTC for
+    tz-aware columns). NaT becomes `_NAT`. Non-datetime input (strings,
+    all-null or malformed values) is coerced first, malformed values to NaT.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        column = pd.to_datetime(column, errors="coerce", utc=True, format="mixed")
+    if column.dt.tz is not None:
+        column = column.dt.tz_convert(None)
+    return column.to_numpy(dtype="datetime64[ns]").view("i8")
+
+
+def _summary_stats_loop(author_codes: np.ndarray, n_authors: int, state_codes: np.ndarray,
+                        closed_code: int, created_ns: np.ndarray, closed_ns: np.ndarray
+                        ) -> Tuple[np.ndarray, int, float, int]:
+    """
+    One pass over the commit and issue arrays. Returns (commits per author id,
+    closed-issue count, summed open days, number of issues with both dates).
+    Compiled with numba when it is installed.
+    """
+    counts = np.zeros(n_authors, dtype=np.int64)
+    for i in range(author_codes.shape[0]):
+        code = author_codes[i]
+        if code >= 0:
+            counts[code] += 1
+
+    n_closed = 0
+    total_days = 0.0
+    n_durations = 0
+    for i in range(state_codes.shape[0]):
+        if state_codes[i] == closed_code:
+            n_closed += 1
+        if created_ns[i] != _NAT and closed_ns[i] != _NAT:
+            total_days += (closed_ns[i] - created_ns[i]) / _NS_PER_DAY
+            n_durations += 1
+    return counts, n_closed, total_days, n_durations
+
+
+def _summary_stats_numpy(author_codes: np.ndarray, n_authors: int, state_codes: np.ndarray,
+                         closed_code: int, created_ns: np.ndarray, closed_ns: np.ndarray
+                         ) -> Tuple[np.ndarray, int, float, int]:
+    """
+    Vectorized equivalent of `_summary_stats_loop`, used without numba.
+    """
+    counts = np.bincount(author_codes[author_codes >= 0], minlength=n_authors)
+    n_closed = int((state_codes == closed_code).sum())
+    mask = (created_ns != _NAT) & (closed_ns != _NAT)
+    total_days = float(((closed_ns[mask] - created_ns[mask]) / _NS_PER_DAY).sum())
+    return counts, n_closed, total_days, int(mask.sum())
+
+
+# The histogram update races under prange, so the kernel is compiled serially;
+# it is bound by memory bandwidth either way
+_summary_stats = njit(cache=True)(_summary_stats_loop) if njit is not None else _summary_stats_numpy
 
 
 def merge_and_summarize(commits_df: pd.DataFrame, issues_df: pd.DataFrame) -> None:
@@ -23,41 +198,39 @@ def merge_and_summarize(commits_df: pd.DataFrame, issues_df: pd.DataFrame) -> No
       - Top 5 committers by commit count
       - Issue close rate (closed/total)
       - Average open duration for closed issues (in days)
+
+    Date columns (commits.date, issues.created_at/closed_at) are best passed
+    as datetime64, as produced by fetch_* or `_read_frame`; other input is
+    coerced, with unparseable values treated as missing.
+    The inputs are only read, never modified, so they are not copied.
     """
-    # Copy to avoid modifying original data
-    commits = commits_df.copy()
-    issues  = issues_df.copy()
-
-    # 1) Normalize date/time columns to pandas datetime
-    commits['date']      = pd.to_datetime(commits['date'], errors='coerce')
-    issues['created_at'] = pd.to_datetime(issues['created_at'], errors='coerce')
-    issues['closed_at']  = pd.to_datetime(issues['closed_at'], errors='coerce')
-
-    # 2) Top 5 committers
-    top = (
-        commits
-        .dropna(subset=['author'])  # Exclude commits without an author
-        .groupby('author', dropna=False)  # Group by author
-        .size()  # Count commits per author
-        .reset_index(name='count')  # Convert to DataFrame
-        .sort_values(['count', 'author'], ascending=[False, True])  # Sort by count desc, author asc
-        .head(5)  # Take top 5
+    # Integer inputs for the single-pass kernel: author ids (-1 = missing),
+    # state category codes and nanosecond timestamps
+    author_codes, authors = pd.factorize(commits_df['author'])
+    if "state" in issues_df:
+        state_codes = issues_df["state"].astype(ISSUE_STATE).cat.codes.to_numpy()
+    else:
+        state_codes = np.full(len(issues_df), -1, dtype=np.int8)
+    counts, closed_issues, total_days, n_durations = _summary_stats(
+        author_codes, len(authors), state_codes, _CLOSED_CODE,
+        _epoch_ns(issues_df["created_at"]), _epoch_ns(issues_df["closed_at"]),
     )
+
+    # 1) Top 5 committers, by count desc then author asc
+    counts = pd.Series(counts, index=authors)
+    top = counts.sort_index().sort_values(ascending=False, kind='stable').head(5)
     print("Top 5 committers:")
-    for _, row in top.iterrows():
-        print(f"  {row['author']}: {row['count']} commits")
+    for author, count in top.items():
+        print(f"  {author}: {count} commits")
 
-    # 3) Calculate issue close rate
-    total_issues = len(issues)
-    closed_issues = (issues["state"].str.lower() == "closed").sum() if "state" in issues else 0
+    # 2) Calculate issue close rate
+    total_issues = len(issues_df)
     close_rate = (closed_issues / total_issues) if total_issues else 0.0
     print(f"Issue close rate: {close_rate:.2f}")
 
-    # 4) Compute average open duration (days) for closed issues
-    closed = issues["closed_at"].notna() & issues["created_at"].notna()
-    durations = (issues.loc[closed, "closed_at"] - issues.loc[closed, "created_at"]).dt.total_seconds() / 86400.0
-    if not durations.empty:
-        avg_days = durations.mean()
+    # 3) Average open duration (days) for closed issues
+    if n_durations:
+        avg_days = total_days / n_durations
         print(f"Avg. issue open duration: {avg_days:.2f} days")
     else:
         print("Avg. issue open duration: N/A")
@@ -65,93 +238,334 @@ def merge_and_summarize(commits_df: pd.DataFrame, issues_df: pd.DataFrame) -> No
 
 
 
-def fetch_issues(repo_full_name: str, state: str = "all", max_issues: int = None) -> pd.DataFrame:
+# Column order of the fetched commit and issue tables
+COMMIT_COLUMNS = ["sha", "author", "email", "date", "message"]
+ISSUE_COLUMNS = ["id", "number", "title", "user", "state", "created_at", "closed_at", "comments"]
+COMMIT_DATE_COLUMNS = ["date"]
+ISSUE_DATE_COLUMNS = ["created_at", "closed_at"]
+
+
+def _columns(rows: Iterable[Tuple], names: List[str]) -> Dict[str, List[object]]:
+    """
+    Transpose row tuples into a mapping of column name -> list of values.
+    """
+    columns = [list(column) for column in zip(*rows)] or [[] for _ in names]
+    return dict(zip(names, columns))
+
+
+def _frame(columns: Dict[str, List[object]], names: List[str], date_columns: List[str]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a column mapping, with `date_columns` converted
+    to datetime64 UTC explicitly, so that all-None or empty columns are not
+    left as object dtype.
+    """
+    df = pd.DataFrame(columns, columns=names)
+    for name in date_columns:
+        df[name] = pd.to_datetime(df[name], utc=True, format="ISO8601")
+    return df
+
+
+def fetch_issues(repo_full_name: str, state: str = "all", max_issues: int = None,
+                 cache_path: Optional[str] = None) -> pd.DataFrame:
     """
     Fetch up to `max_issues` from the specified GitHub repository (issues only).
     Returns a DataFrame with columns: id, number, title, user, state, created_at, closed_at, comments.
+    If `cache_path` is given, results are reused while the repository's issues are unchanged.
+    """
+    gh = _gh()
+
+    # Any issue edit (closing and reopening included) moves it to the top of
+    # the most-recently-updated listing; probe all states, since a filtered
+    # listing just loses an issue whose state changed
+    columns = _conditional_fetch(
+        gh, cache_path, f"{repo_full_name}|issues|{state}|{max_issues}",
+        f"/repos/{repo_full_name}/issues",
+        {"state": "all", "sort": "updated", "direction": "desc", "per_page": 1},
+        lambda: _columns(iter_issues(repo_full_name, state, max_issues), ISSUE_COLUMNS),
+    )
+
+    return _frame(columns, ISSUE_COLUMNS, ISSUE_DATE_COLUMNS).astype({"state": ISSUE_STATE})
+
+
+def iter_issues(repo_full_name: str, state: str = "all",
+                max_issues: Optional[int] = None) -> Iterator[Tuple]:
     """
-    token = os.getenv("GITHUB_TOKEN")
-    gh = Github(token)
+    Page through the repository's issues and yield each one (skipping PRs)
+    as a tuple in ISSUE_COLUMNS order.
+    """
+    gh = _gh()
     repo = gh.get_repo(repo_full_name)
 
-    records: List[Dict[str, object]] = []
     count = 0
-
-    for issue in repo.get_issues(state=state):
+    for idx, issue in enumerate(repo.get_issues(state=state)):
         if max_issues is not None and count >= max_issues:
             break
-
-        #Skip pr's
-        if hasattr(issue, "pull_request") and issue.pull_request is not None:
+        # Check the quota at each page boundary
+        if idx % PER_PAGE == 0:
+            _wait_for_rate_limit(gh)
+
+        #Skip pr's. html_url is always in the list payload; pull_request is
+        # only there for PRs, so reading it on a plain issue would make
+        # PyGithub complete the object with an extra GET per issue
+        if "/pull/" in issue.html_url:
             continue
 
-        created = issue.created_at
-        closed = issue.closed_at
-
-        open_days = None
-        if closed is not None and created is not None:
-            #Calculate days open for
-            open_days = (closed - created).days
-
-        records.append({
-            "id": getattr(issue, "id"),
-            "number": getattr(issue, "number"),
-            "title": getattr(issue, "title"),
-            "user": getattr(issue.user, "login") if getattr(issue, "user", None) else None,
-            "state": getattr(issue, "state"),
-            "created_at": created.isoformat() if created else None,
-            "closed_at": closed.isoformat() if closed else None,
-            "comments": getattr(issue, "comments"),
-            "open_duration_days": open_days,
-        })
+        user = issue.user
+
+        yield (
+            issue.id,
+            issue.number,
+            issue.title,
+            user.login if user else None,
+            issue.state,
+            issue.created_at,
+            issue.closed_at,
+            issue.comments,
+        )
         count += 1
 
-    return pd.DataFrame.from_records(
-        records,
-        columns=["id", "number", "title", "user", "state", "created_at", "closed_at", "comments", "open_duration_days"]
-    )
-
 
-def fetch_commits(repo_name: str, max_commits: int = None) -> pd.DataFrame:
+def fetch_commits(repo_name: str, max_commits: int = None,
+                  cache_path: Optional[str] = None) -> pd.DataFrame:
     """
     Fetch up to `max_commits` from the specified GitHub repository.
     Returns a DataFrame with columns: sha, author, email, date, message.
+    If `cache_path` is given, commits are memoized there (see `_cached_commits`).
     """
-    # 1) Read GitHub token from environment
-    # TODO
-    token = os.getenv("GITHUB_TOKEN")
-    github = Github(token)
+    if cache_path is not None:
+        return _cached_commits(cache_path, repo_name, max_commits)
+    return _frame(_columns(iter_commits(repo_name, max_commits), COMMIT_COLUMNS),
+                  COMMIT_COLUMNS, COMMIT_DATE_COLUMNS)
 
-    repo = github.get_repo(repo_name)
 
+def _cached_commits(cache_path: str, repo_name: str, max_commits: Optional[int]) -> pd.DataFrame:
+    """
+    Commits are immutable, so each one is fetched once and memoized by SHA in
+    the sqlite file `cache_path`, with `seq` recording its place in history
+    (larger = closer to HEAD). Once the full history is stored, later runs
+    page from HEAD only until a whole page of already stored SHAs (see
+    `_new_history`), and skip even that when an ETag probe of the history
+    answers 304. The result is read back in history order, so it matches an
+    uncached fetch, `max_commits` included.
+    """
+    with closing(sqlite3.connect(cache_path)) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS commit_history (repo TEXT, sha TEXT, seq INTEGER, author TEXT,"
+            " email TEXT, date TEXT, message TEXT, PRIMARY KEY (repo, sha))"
+        )
+        # One row per repository whose full history has been stored
+        conn.execute("CREATE TABLE IF NOT EXISTS commit_history_sync (repo TEXT PRIMARY KEY, etag TEXT)")
+        sync = conn.execute("SELECT etag FROM commit_history_sync WHERE repo = ?", (repo_name,)).fetchone()
+
+        # The first page of history changes whenever new commits land
+        headers = {"If-None-Match": sync[0]} if sync and sync[0] else {}
+        status, response_headers, _ = _gh().requester.requestJson(
+            "GET", f"/repos/{repo_name}/commits", parameters={"per_page": 1}, headers=headers
+        )
+
+        if sync is None or status != 304:
+            if sync is None:
+                rows, join_seq = list(iter_commits(repo_name, max_commits)), None
+            else:
+                rows, join_seq = _new_history(conn, repo_name)
+
+            with conn:
+                if join_seq is None:
+                    conn.execute("DELETE FROM commit_history WHERE repo = ?", (repo_name,))
+                else:
+                    # Everything from the join point up was re-fetched; what is
+                    # missing from the new listing was dropped (e.g. force-push)
+                    conn.execute("DELETE FROM commit_history WHERE repo = ? AND seq >= ?",
+                                 (repo_name, join_seq))
+                (base,) = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM commit_history WHERE repo = ?",
+                                       (repo_name,)).fetchone()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO commit_history (repo, sha, seq, author, email, date, message)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(repo_name, sha, base + len(rows) - i, author, email,
+                      date.isoformat() if date else None, message)
+                     for i, (sha, author, email, date, message) in enumerate(rows)],
+                )
+                # A run cut short by max_commits has not seen the whole history
+                if sync is not None or max_commits is None or len(rows) < max_commits:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO commit_history_sync (repo, etag) VALUES (?, ?)",
+                        (repo_name, response_headers.get("etag")),
+                    )
+
+        query = ("SELECT sha, author, email, date, message FROM commit_history"
+                 " WHERE repo = ? ORDER BY seq DESC")
+        params: List[object] = [repo_name]
+        if max_commits is not None:
+            query += " LIMIT ?"
+            params.append(max_commits)
+        return pd.read_sql_query(query, conn, params=params,
+                                 parse_dates={"date": {"format": "ISO8601", "utc": True}})
+
+
+def _new_history(conn: sqlite3.Connection, repo_name: str) -> Tuple[List[Tuple], Optional[int]]:
+    """
+    Page through the history from HEAD until a whole page of commits is
+    already stored. Returns the fetched rows and the stored `seq` of the
+    last one, where the new listing joins the stored history; the join is
+    None when the listing ran out first, i.e. the rows are the full history.
+    """
+    stored = dict(conn.execute("SELECT sha, seq FROM commit_history WHERE repo = ?", (repo_name,)))
+    rows: List[Tuple] = []
+    page_known = True
+    for row in iter_commits(repo_name):
+        rows.append(row)
+        page_known = page_known and row[0] in stored
+        if len(rows) % PER_PAGE == 0:
+            if page_known:
+                return rows, stored[row[0]]
+            page_known = True
+    return rows, None
+
+
+def iter_commits(repo_name: str, max_commits: Optional[int] = None) -> Iterator[Tuple]:
+    """
+    Page through the repository's commits and yield each one as a
+    (sha, author, email, date, message) tuple.
+    """
+    github = _gh()
+    repo = github.get_repo(repo_name)
 
-    records: List[Dict[str, str]] = []
     count = 0
     for c in repo.get_commits():
-
-        commit_author = getattr(c.commit, "author")
-        author_name = getattr(commit_author, "name")
-        author_email = getattr(commit_author, "email")
-        author_date = getattr(commit_author, "date")
-
-        records.append(
-            {
-                "sha": getattr(c, "sha"),
-                "author": author_name,
-                "email": author_email,
-                "date": author_date.isoformat(),
-                "message": getattr(c.commit, "message").splitlines()[0].strip(),
-            }
+        # Check the quota at each page boundary
+        if count % PER_PAGE == 0:
+            _wait_for_rate_limit(github)
+
+        git_commit = c.commit
+        commit_author = git_commit.author
+
+        yield (
+            c.sha,
+            commit_author.name,
+            commit_author.email,
+            commit_author.date,
+            # First line only; partition stops at the first newline (strip drops a trailing \r)
+            git_commit.message.partition("\n")[0].strip(),
         )
         count += 1
         if max_commits is not None and count >= max_commits:
             break
 
 
-    return pd.DataFrame.from_records(
-        records, columns=["sha", "author", "email", "date", "message"]
-    )
-    
+# Output formats accepted by --format, and the file extensions summarize recognizes
+FORMATS = ["csv", "feather", "parquet"]
+_EXTENSIONS = {".feather": "feather", ".parquet": "parquet", ".pq": "parquet"}
+# Compressed CSV suffixes pandas infers from the path (pyarrow's writer does not)
+_COMPRESSED = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar")
+# gzip level for .gz output: level 1 is several times faster than pandas'
+# default of 9 and gives ~90% of its compression on CSV text
+DEFAULT_COMPRESS_LEVEL = 1
+# Rows per to_csv chunk, so pandas never formats the whole frame at once
+CSV_CHUNKSIZE = 65536
+
+
+def _write_csv(df: pd.DataFrame, path: str, compress_level: int = DEFAULT_COMPRESS_LEVEL) -> None:
+    """
+    Write `df` as CSV with pyarrow's C writer when available, else pandas.
+    `.gz` paths are gzipped at `compress_level`; other compression
+    suffixes are inferred by pandas.
+    Either way dates are written as ISO-8601 in UTC, like `_stream_csv`
+    does; pyarrow formats them in C (to whole seconds, the resolution of
+    GitHub timestamps) and, unlike pandas, quotes every string field.
+    """
+    date_columns = [name for name in df.columns if pd.api.types.is_datetime64_any_dtype(df[name])]
+    df = df.assign(**{
+        name: df[name].dt.tz_convert("UTC")
+        for name in date_columns if df[name].dt.tz is not None
+    })
+    if pa_csv is not None and not path.lower().endswith(_COMPRESSED):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # mixed-type object column: let pandas handle it
+        else:
+            for name in date_columns:
+                index = table.schema.get_field_index(name)
+                tz = table.schema.field(index).type.tz
+                seconds = pa_compute.cast(table.column(index), pa.timestamp("s", tz=tz), safe=False)
+                table = table.set_column(index, name, pa_compute.strftime(
+                    seconds, format="%Y-%m-%dT%H:%M:%S" + ("+00:00" if tz else "")))
+            pa_csv.write_csv(table, path)
+            return
+    # pandas fallback: per-value isoformat (already a per-row Python writer)
+    df = df.assign(**{
+        name: df[name].map(lambda t: t.isoformat(), na_action="ignore") for name in date_columns
+    })
+    if path.lower().endswith(".gz"):
+        # Fixed mtime keeps the gzip header (and so the file) reproducible
+        compression = {"method": "gzip", "compresslevel": compress_level, "mtime": 1}
+    else:
+        compression = "infer"
+    df.to_csv(path, index=False, compression=compression, chunksize=CSV_CHUNKSIZE)
+
+
+def _write_frame(df: pd.DataFrame, path: str, fmt: str = "csv",
+                 compress_level: int = DEFAULT_COMPRESS_LEVEL) -> None:
+    """
+    Save `df` to `path` as CSV (gzipped at `compress_level` for `.gz`),
+    Feather (zstd) or Parquet (snappy).
+    Feather/Parquet need pyarrow and keep column dtypes, datetimes included.
+    """
+    if fmt == "feather":
+        df.to_feather(path, compression="zstd")
+    elif fmt == "parquet":
+        df.to_parquet(path, compression="snappy", index=False)
+    else:
+        _write_csv(df, path, compress_level)
+
+
+def _read_frame(path: str, date_columns: List[str]) -> pd.DataFrame:
+    """
+    Load a file written by `_write_frame`, choosing the reader by extension.
+    CSV files get `date_columns` parsed to datetime64; Feather/Parquet
+    already store them that way.
+    """
+    fmt = _EXTENSIONS.get(os.path.splitext(path)[1].lower(), "csv")
+    if fmt == "feather":
+        return pd.read_feather(path)
+    if fmt == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, parse_dates=date_columns)
+
+
+def _stream_csv(rows: Iterable[Tuple], header: List[str], path: str) -> int:
+    """
+    Write `rows` to the CSV file at `path` as they arrive, without building
+    a DataFrame. Datetimes are written as ISO-8601. Returns the row count.
+    Rows go to a temporary file next to `path`, which replaces `path` only
+    once every row is written, so a failed fetch leaves an existing file intact.
+    """
+    count = 0
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # A 1 MiB buffer keeps the per-row writes from each becoming a syscall
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+            writer = csv.writer(fh)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow([v.isoformat() if isinstance(v, datetime) else v for v in row])
+                count += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+
+def _can_stream(args: argparse.Namespace) -> bool:
+    """
+    Whether a fetch-* command can stream straight to its output file:
+    plain CSV, with no cache to fill.
+    """
+    return args.format == "csv" and args.cache is None and not args.out.lower().endswith(_COMPRESSED)
+
 
 def main():
     """
@@ -164,44 +578,64 @@ def main():
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Sub-command: fetch-commits
-    c1 = subparsers.add_parser("fetch-commits", help="Fetch commits and save to CSV")
+    c1 = subparsers.add_parser("fetch-commits", help="Fetch commits and save to CSV/Feather/Parquet")
     c1.add_argument("--repo", required=True, help="Repository in owner/repo format")
     c1.add_argument("--max",  type=int, dest="max_commits",
                     help="Max number of commits to fetch")
-    c1.add_argument("--out",  required=True, help="Path to output commits CSV")
+    c1.add_argument("--out",  required=True, help="Path to output commits file")
+    c1.add_argument("--format", choices=FORMATS, default="csv",
+                    help="Output file format (feather/parquet need pyarrow)")
+    c1.add_argument("--compress-level", type=int, choices=range(10), default=DEFAULT_COMPRESS_LEVEL,
+                    metavar="0-9", help="gzip level for .gz CSV output (default: 1)")
+    c1.add_argument("--cache", help="sqlite file memoizing commits by SHA, so later runs only fetch new ones")
 
 
     # Sub-command: fetch-issues
-    c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV")
+    c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV/Feather/Parquet")
     c2.add_argument("--repo", required=True, help="Repository in owner/repo format")
     c2.add_argument("--state", choices=["all", "open", "closed"], default="all",
                     help="Filter issues by state")
     c2.add_argument("--max", type=int, dest="max_issues",
                     help="Max number of issues to fetch")
-    c2.add_argument("--out", required=True, help="Path to output issues CSV")
+    c2.add_argument("--out", required=True, help="Path to output issues file")
+    c2.add_argument("--format", choices=FORMATS, default="csv",
+                    help="Output file format (feather/parquet need pyarrow)")
+    c2.add_argument("--compress-level", type=int, choices=range(10), default=DEFAULT_COMPRESS_LEVEL,
+                    metavar="0-9", help="gzip level for .gz CSV output (default: 1)")
+    c2.add_argument("--cache", help="sqlite file for reusing unchanged results across runs")
 
     # Sub-command: summarize
     c3 = subparsers.add_parser("summarize", help="Summarize commits and issues")
-    c3.add_argument("--commits", required=True, help="Path to commits CSV file")
-    c3.add_argument("--issues", required=True, help="Path to issues CSV file")
+    c3.add_argument("--commits", required=True,
+                    help="Path to commits file (.csv, .feather or .parquet)")
+    c3.add_argument("--issues", required=True,
+                    help="Path to issues file (.csv, .feather or .parquet)")
 
     args = parser.parse_args()
 
     # Dispatch based on selected command
     if args.command == "fetch-commits":
-        df = fetch_commits(args.repo, args.max_commits)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} commits to {args.out}")
+        if _can_stream(args):
+            count = _stream_csv(iter_commits(args.repo, args.max_commits), COMMIT_COLUMNS, args.out)
+        else:
+            df = fetch_commits(args.repo, args.max_commits, args.cache)
+            _write_frame(df, args.out, args.format, args.compress_level)
+            count = len(df)
+        print(f"Saved {count} commits to {args.out}")
 
     elif args.command == "fetch-issues":
-        df = fetch_issues(args.repo, args.state, args.max_issues)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} issues to {args.out}")
+        if _can_stream(args):
+            count = _stream_csv(iter_issues(args.repo, args.state, args.max_issues), ISSUE_COLUMNS, args.out)
+        else:
+            df = fetch_issues(args.repo, args.state, args.max_issues, args.cache)
+            _write_frame(df, args.out, args.format, args.compress_level)
+            count = len(df)
+        print(f"Saved {count} issues to {args.out}")
 
     elif args.command == "summarize":
-        # Read CSVs into DataFrames
-        commits_df = pd.read_csv(args.commits)
-        issues_df = pd.read_csv(args.issues)
+        # Read inputs into DataFrames (format picked by file extension)
+        commits_df = _read_frame(args.commits, COMMIT_DATE_COLUMNS)
+        issues_df = _read_frame(args.issues, ISSUE_DATE_COLUMNS)
         # Generate and print the summary
         merge_and_summarize(commits_df, issues_df)
 
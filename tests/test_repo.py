@@ -6,7 +6,9 @@ import pytest
 from datetime import datetime, timedelta
 from src.repo_miner import fetch_commits
 from src.repo_miner import fetch_issues
-import re
+from src.repo_miner import merge_and_summarize
+from src.repo_miner import _wait_for_rate_limit
+from src.repo_miner import _write_frame, _read_frame
 
 # --- Helpers for dummy GitHub API objects ---
 
@@ -40,8 +42,16 @@ class DummyIssue:
         self.created_at = created_at
         self.closed_at = closed_at
         self.comments = comments
-        # attribute only on pull requests
-        self.pull_request = DummyUser("pr") if is_pr else None
+        self.is_pr = is_pr
+        self.html_url = f"https://github.com/any/repo/{'pull' if is_pr else 'issues'}/{number}"
+
+    @property
+    def pull_request(self):
+        # Like PyGithub: absent from the list payload for plain issues, so
+        # reading it would trigger a lazy GET of the full issue
+        if not self.is_pr:
+            raise AssertionError("lazy fetch of a plain issue")
+        return DummyUser("pr")
 
 class DummyRepo:
     def __init__(self, commits, issues):
@@ -49,7 +59,10 @@ class DummyRepo:
         self._issues = issues
 
     def get_commits(self):
-        return self._commits
+        self.paged = 0
+        for c in self._commits:
+            self.paged += 1
+            yield c
 
     def get_issues(self, state="all"):
         # filter by state
@@ -57,9 +70,22 @@ class DummyRepo:
             return self._issues
         return [i for i in self._issues if i.state == state]
 
+class DummyRequester:
+    """Answers conditional GETs: 304 when If-None-Match matches `etag`."""
+    def __init__(self, etag="v1"):
+        self.etag = etag
+    def requestJson(self, verb, url, parameters=None, headers=None):
+        self.parameters = parameters
+        if headers and headers.get("If-None-Match") == self.etag:
+            return 304, {"etag": self.etag}, ""
+        return 200, {"etag": self.etag}, "[]"
+
 class DummyGithub:
     def __init__(self, token):
         assert token == "fake-token"
+        self.rate_limiting = (5000, 5000)
+        self.rate_limiting_resettime = 0
+        self.requester = DummyRequester()
     def get_repo(self, repo_name):
         # ignore repo_name; return repo set in test fixture
         return self._repo
@@ -68,10 +94,18 @@ class DummyGithub:
 def patch_env_and_github(monkeypatch):
     # Set fake token
     monkeypatch.setenv("GITHUB_TOKEN", "fake-token")
+    monkeypatch.delenv("GITHUB_TOKENS", raising=False)
     # Patch Github class
     import src.repo_miner as rm
-    monkeypatch.setattr(rm, "Github", lambda token: gh_instance)
+    def make_github(token, **kwargs):
+        gh_instance.kwargs = kwargs
+        return gh_instance
+    monkeypatch.setattr(rm, "Github", make_github)
+    rm._clients.cache_clear()
     gh_instance._repo = DummyRepo([], [])
+    gh_instance.rate_limiting = (5000, 5000)
+    gh_instance.rate_limiting_resettime = 0
+    gh_instance.requester = DummyRequester()
     yield
     # TODO
 
@@ -93,6 +127,16 @@ def test_fetch_commits_basic(monkeypatch):
     assert len(df) == 2
     assert df.iloc[0]["message"] == "Initial commit"
 
+def test_fetch_commits_message_first_line(monkeypatch):
+    now = datetime.now()
+    commits = [
+        DummyCommit("sha1", "Alice", "a@example.com", now, "  Windows line\r\nBody\r\n"),
+        DummyCommit("sha2", "Bob", "b@example.com", now, ""),
+    ]
+    gh_instance._repo = DummyRepo(commits, [])
+    df = fetch_commits("any/repo")
+    assert list(df["message"]) == ["Windows line", ""]
+
 def test_fetch_commits_limit(monkeypatch):
     # More commits than max_commits
     # TODO： Test that fetch_commits respects the max_commits limit.
@@ -107,6 +151,43 @@ def test_fetch_commits_limit(monkeypatch):
     assert len(df) == 3
     assert list(df["sha"]) == ["sha0", "sha1", "sha2"]
 
+def test_fetch_uses_max_page_size(monkeypatch):
+    import src.repo_miner as rm
+    # 100 items per round-trip instead of PyGithub's default 30; clear the
+    # shared client between calls so each fetch builds (and checks) its own
+    for fetch in (fetch_commits, fetch_issues):
+        rm._clients.cache_clear()
+        gh_instance.kwargs = None
+        fetch("any/repo")
+        assert gh_instance.kwargs["per_page"] == 100
+
+def test_github_client_is_reused(monkeypatch):
+    import src.repo_miner as rm
+    calls = []
+    monkeypatch.setattr(rm, "Github", lambda token, **kwargs: calls.append(token) or gh_instance)
+    rm._clients.cache_clear()
+    fetch_commits("any/repo")
+    fetch_issues("any/repo")
+    list(rm.iter_commits("any/repo"))
+    assert calls == ["fake-token"]
+
+def test_multiple_tokens_pick_most_remaining(monkeypatch):
+    import src.repo_miner as rm
+    clients = {}
+    def make_github(token, **kwargs):
+        clients[token] = DummyGithub("fake-token")
+        return clients[token]
+    monkeypatch.setattr(rm, "Github", make_github)
+    monkeypatch.setenv("GITHUB_TOKENS", "tok-a, tok-b")
+    rm._clients.cache_clear()
+
+    assert len(rm._clients()) == 2
+    clients["tok-a"].rate_limiting = (10, 5000)
+    clients["tok-b"].rate_limiting = (4000, 5000)
+    assert rm._gh() is clients["tok-b"]
+    clients["tok-a"].rate_limiting = (4500, 5000)
+    assert rm._gh() is clients["tok-a"]
+
 def test_fetch_commits_empty(monkeypatch):
     gh_instance._repo = DummyRepo([],[])
     df = fetch_commits("any/repo")
@@ -124,18 +205,54 @@ def test_fetch_issues_iso(monkeypatch):
     df = fetch_issues("any/repo", state="all")
     assert {"id", "number", "title", "user", "state", "created_at", "closed_at", "comments"}.issubset(df.columns)
     assert len(df) == 2
-    # Check date normalization
-    iso = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+    # Check date normalization: dates stay datetimes (no ISO string round-trip)
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+    assert pd.api.types.is_datetime64_any_dtype(df["closed_at"])
 
-    #(open issue): created_at is ISO closed_at is None
+    #(open issue): created_at is a timestamp, closed_at is missing
     r0 = df.iloc[0]
-    assert isinstance(r0["created_at"], str) and iso.match(r0["created_at"])
-    assert r0["closed_at"] is None
+    assert r0["created_at"] == pd.Timestamp(now, tz="UTC")
+    assert pd.isna(r0["closed_at"])
 
-    #(closed issue): both created_at and closed_at are ISO strings
+    #(closed issue): both created_at and closed_at are timestamps
     r1 = df.iloc[1]
-    assert isinstance(r1["created_at"], str) and iso.match(r1["created_at"])
-    assert isinstance(r1["closed_at"], str) and iso.match(r1["closed_at"])
+    assert r1["created_at"] == pd.Timestamp(now - timedelta(days=2), tz="UTC")
+    assert r1["closed_at"] == pd.Timestamp(now, tz="UTC")
+    assert isinstance(df["state"].dtype, pd.CategoricalDtype)
+    assert list(df["state"]) == ["open", "closed"]
+
+
+def test_fetch_issues_all_open_dates_typed(monkeypatch):
+    # No closed issue (or no issue at all): the date columns must still be datetime64
+    now = datetime.now()
+    for issues in ([DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0)], []):
+        gh_instance._repo = DummyRepo([], issues)
+        df = fetch_issues("any/repo", state="open")
+        assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+        assert pd.api.types.is_datetime64_any_dtype(df["closed_at"])
+    df = fetch_commits("any/repo")
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+
+
+def test_summarize_all_open_issues(tmp_path, capsys):
+    now = datetime(2025, 9, 20, 12, 0, 0)
+    gh_instance._repo = DummyRepo(
+        [DummyCommit("sha1", "Alice", "a@example.com", now, "Initial")],
+        [DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0)],
+    )
+    commits, issues = fetch_commits("any/repo"), fetch_issues("any/repo", state="open")
+    merge_and_summarize(commits, issues)
+    out = capsys.readouterr().out
+    assert "Issue close rate: 0.00" in out
+    assert "Avg. issue open duration: N/A" in out
+
+    # Same through a Feather round-trip (all-null closed_at keeps its dtype)
+    pytest.importorskip("pyarrow")
+    _write_frame(commits, str(tmp_path / "c.feather"), "feather")
+    _write_frame(issues, str(tmp_path / "i.feather"), "feather")
+    merge_and_summarize(_read_frame(str(tmp_path / "c.feather"), ["date"]),
+                        _read_frame(str(tmp_path / "i.feather"), ["created_at", "closed_at"]))
+    assert "Avg. issue open duration: N/A" in capsys.readouterr().out
 
 
 def test_fetch_issues_excludes_prs(monkeypatch):
@@ -149,17 +266,318 @@ def test_fetch_issues_excludes_prs(monkeypatch):
     df = fetch_issues("any/repo", state="all")
     # PR is excluded
     assert set(df["title"]) == {"Real issue"}
-    assert {"id","number","title","user","state","created_at","closed_at","comments","open_duration_days"}.issubset(df.columns)
+    assert list(df.columns) == ["id", "number", "title", "user", "state", "created_at", "closed_at", "comments"]
 
 
-def test_fetch_issues_duration_calculate(monkeypatch):
+def test_fetch_issues_duration_calculate(capsys):
     created = datetime(2025, 9, 20, 12, 0, 0)
     closed = datetime(2025, 9, 22, 9, 0, 0)  # ~1 day 21h later
     issues = [DummyIssue(10, 210, "Closed", "michael", "closed", created, closed, 3, is_pr=False)]
     gh_instance._repo = DummyRepo([], issues)
     df = fetch_issues("any/repo", state="closed")
 
-    row = df.iloc[0]
-    assert row["open_duration_days"] == 1
+    # Durations are derived at summarize time, not stored per issue
+    merge_and_summarize(fetch_commits("any/repo"), df)
+    assert "Avg. issue open duration: 1.88 days" in capsys.readouterr().out
+
+
+def test_wait_for_rate_limit(monkeypatch):
+    import src.repo_miner as rm
+    slept = []
+    monkeypatch.setattr(rm.time, "sleep", slept.append)
+    monkeypatch.setattr(rm.time, "time", lambda: 1000.0)
+
+    # Plenty of quota left: no pause
+    gh_instance.rate_limiting = (4000, 5000)
+    gh_instance.rate_limiting_resettime = 1060
+    _wait_for_rate_limit(gh_instance)
+    assert slept == []
+
+    # Quota nearly exhausted: sleep until the window resets
+    gh_instance.rate_limiting = (3, 5000)
+    _wait_for_rate_limit(gh_instance)
+    assert slept == [61.0]
+
+
+def _history(*shas, base=datetime(2025, 9, 20, 12, 0, 0)):
+    # Newest first, as the API lists them; author dates need not follow history order
+    return [DummyCommit(sha, "Dev", "d@ex.com", base - timedelta(hours=i), f"Msg {sha}")
+            for i, sha in enumerate(shas)]
+
+
+def test_fetch_commits_cache(tmp_path, monkeypatch):
+    import src.repo_miner as rm
+    monkeypatch.setattr(rm, "PER_PAGE", 2)
+    cache = str(tmp_path / "cache.db")
+    old = _history("s5", "s4", "s3", "s2", "s1")
+    gh_instance._repo = DummyRepo(old, [])
+    df = fetch_commits("any/repo", cache_path=cache)
+    assert list(df["sha"]) == ["s5", "s4", "s3", "s2", "s1"]
+    assert df.loc[0, "date"] == pd.Timestamp(datetime(2025, 9, 20, 12, 0, 0), tz="UTC")
+
+    # Unchanged ETag (304): served from the cache without paging the API
+    gh_instance._repo = DummyRepo([], [])
+    assert list(fetch_commits("any/repo", cache_path=cache)["sha"]) == ["s5", "s4", "s3", "s2", "s1"]
+
+    # New ETag: page from HEAD until a page of known SHAs. The merged-in m1
+    # has an old author date but still shows up, in history order
+    gh_instance.requester.etag = "v2"
+    merged = _history("m2", "m1", base=datetime(2020, 1, 1))
+    gh_instance._repo = DummyRepo(merged + old, [])
+    df = fetch_commits("any/repo", cache_path=cache)
+    assert gh_instance._repo.paged == 4
+    assert list(df["sha"]) == ["m2", "m1", "s5", "s4", "s3", "s2", "s1"]
+
+    # --max picks the same commits as an uncached fetch
+    uncached = fetch_commits("any/repo", max_commits=3)
+    cached = fetch_commits("any/repo", max_commits=3, cache_path=cache)
+    assert list(cached["sha"]) == list(uncached["sha"]) == ["m2", "m1", "s5"]
+
+
+def test_fetch_commits_cache_force_push(tmp_path, monkeypatch):
+    import src.repo_miner as rm
+    monkeypatch.setattr(rm, "PER_PAGE", 2)
+    cache = str(tmp_path / "cache.db")
+    gh_instance._repo = DummyRepo(_history("s4", "s3", "s2", "s1"), [])
+    fetch_commits("any/repo", cache_path=cache)
+
+    # s4 and s3 are rewritten as r3; they disappear from the cached history
+    gh_instance.requester.etag = "v2"
+    gh_instance._repo = DummyRepo(_history("r3", "s2", "s1"), [])
+    df = fetch_commits("any/repo", cache_path=cache)
+    assert list(df["sha"]) == ["r3", "s2", "s1"]
+
+
+def test_fetch_commits_cache_partial_history(tmp_path):
+    # A run limited by --max has not stored the full history, so the next run pages normally
+    cache = str(tmp_path / "cache.db")
+    gh_instance._repo = DummyRepo(_history("s2", "s1", "s0"), [])
+    assert len(fetch_commits("any/repo", max_commits=1, cache_path=cache)) == 1
+    df = fetch_commits("any/repo", cache_path=cache)
+    assert gh_instance._repo.paged == 3
+    assert list(df["sha"]) == ["s2", "s1", "s0"]
+
+
+@pytest.mark.parametrize("fmt,ext", [("csv", ".csv"), ("feather", ".feather"), ("parquet", ".parquet")])
+def test_write_read_frame_roundtrip(tmp_path, fmt, ext):
+    if fmt != "csv":
+        pytest.importorskip("pyarrow")
+    now = datetime(2025, 9, 20, 12, 0, 0)
+    issues = [
+        DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0),
+        DummyIssue(2, 102, "Issue B", "bob", "closed", now - timedelta(days=2), now, 2),
+    ]
+    gh_instance._repo = DummyRepo([], issues)
+    df = fetch_issues("any/repo")
+
+    path = str(tmp_path / f"issues{ext}")
+    _write_frame(df, path, fmt)
+    back = _read_frame(path, ["created_at", "closed_at"])
+    assert list(back.columns) == list(df.columns)
+    assert pd.api.types.is_datetime64_any_dtype(back["created_at"])
+    assert back.loc[1, "closed_at"] == pd.Timestamp(now, tz="UTC")
+    assert pd.isna(back.loc[0, "closed_at"])
+
+
+def test_write_csv_pandas_fallback(tmp_path, monkeypatch):
+    import src.repo_miner as rm
+    monkeypatch.setattr(rm, "pa_csv", None)
+    df = pd.DataFrame({"sha": ["a"], "author": ["X, Y"], "date": [pd.Timestamp("2025-01-01", tz="UTC")]})
+    path = str(tmp_path / "commits.csv")
+    _write_frame(df, path)
+    back = _read_frame(path, ["date"])
+    assert back.loc[0, "author"] == "X, Y"
+    assert back.loc[0, "date"] == df.loc[0, "date"]
+
+
+# --- Tests for merge_and_summarize ---
+
+def test_merge_and_summarize_top_committers(capsys):
+    now = pd.Timestamp("2025-09-20")
+    authors = ["Carol", "alice", "Bob", "Bob", "Dave", "Eve", "Carol", None, None, None]
+    commits = pd.DataFrame({"author": authors, "date": [now] * len(authors)})
+    issues = pd.DataFrame({"state": pd.Series([], dtype=str), "created_at": pd.to_datetime([]), "closed_at": pd.to_datetime([])})
+    merge_and_summarize(commits, issues)
+    out = capsys.readouterr().out
+    # Count desc, ties by author asc; missing authors are not counted
+    assert out.splitlines()[:6] == [
+        "Top 5 committers:",
+        "  Bob: 2 commits",
+        "  Carol: 2 commits",
+        "  Dave: 1 commits",
+        "  Eve: 1 commits",
+        "  alice: 1 commits",
+    ]
+
+
+def test_merge_and_summarize_issue_stats(capsys):
+    commits = pd.DataFrame({"author": pd.Series([], dtype=str), "date": pd.to_datetime([])})
+    issues = pd.DataFrame({
+        "state": ["closed", "open", "closed", "open"],
+        "created_at": pd.to_datetime(["2025-09-01 00:00", "2025-09-02 00:00", "2025-09-03 12:00", "2025-09-04 00:00"]),
+        "closed_at": pd.to_datetime(["2025-09-03 00:00", None, "2025-09-04 00:00", None]),
+    })
+    before = issues.copy()
+    merge_and_summarize(commits, issues)
+    out = capsys.readouterr().out
+    # Inputs are left untouched
+    pd.testing.assert_frame_equal(issues, before)
+    assert "Issue close rate: 0.50" in out
+    # (2 days + 0.5 days) / 2 closed issues
+    assert "Avg. issue open duration: 1.25 days" in out
+
+
+def test_main_streams_commits_csv(tmp_path, monkeypatch, capsys):
+    import sys
+    import src.repo_miner as rm
+    now = datetime(2025, 9, 20, 12, 0, 0)
+    commits = [
+        DummyCommit("sha1", "Alice", "a@example.com", now, "Initial commit\nDetails"),
+        DummyCommit("sha2", "Doe, Jane", "j@example.com", now - timedelta(days=1), "Bug fix"),
+    ]
+    gh_instance._repo = DummyRepo(commits, [])
+    out = tmp_path / "commits.csv"
+    # No DataFrame on the streaming path
+    monkeypatch.setattr(rm, "fetch_commits", None)
+    monkeypatch.setattr(sys, "argv", ["repo_miner", "fetch-commits", "--repo", "any/repo", "--out", str(out)])
+    rm.main()
+    assert "Saved 2 commits" in capsys.readouterr().out
+
+    df = pd.read_csv(out, parse_dates=["date"])
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+    assert list(df["author"]) == ["Alice", "Doe, Jane"]
+    assert df.loc[0, "date"] == now
+    assert df.loc[0, "message"] == "Initial commit"
+
+
+def test_merge_and_summarize_duration_mixed_tz(capsys):
+    # read_csv gives a tz-aware created_at but a naive closed_at when that column is empty
+    commits = pd.DataFrame({"author": pd.Series([], dtype=str), "date": pd.to_datetime([])})
+    issues = pd.DataFrame({
+        "state": ["open", "open"],
+        "created_at": pd.to_datetime(["2025-09-01T00:00:00+00:00", "2025-09-02T00:00:00+00:00"]),
+        "closed_at": pd.to_datetime([None, None]),
+    })
+    merge_and_summarize(commits, issues)
+    assert "Avg. issue open duration: N/A" in capsys.readouterr().out
 
 
+def test_summary_stats_loop_matches_numpy():
+    import numpy as np
+    import src.repo_miner as rm
+    nat = np.datetime64("NaT").view("i8")
+    day = 86400 * 10**9
+    args = (
+        np.array([0, 1, -1, 0, 2], dtype=np.intp), 3,
+        np.array([1, 0, 1, -1], dtype=np.int8), 1,
+        np.array([0, day, 2 * day, nat], dtype=np.int64),
+        np.array([day // 2, nat, 5 * day, 3 * day], dtype=np.int64),
+    )
+    counts, n_closed, total_days, n = rm._summary_stats_loop(*args)
+    assert list(counts) == [2, 1, 1]
+    assert (n_closed, total_days, n) == (2, 3.5, 2)
+
+    np_counts, *np_rest = rm._summary_stats_numpy(*args)
+    assert list(np_counts) == list(counts)
+    assert tuple(np_rest) == (n_closed, total_days, n)
+
+
+def test_write_csv_gzip_level(tmp_path):
+    import gzip
+    df = pd.DataFrame({"sha": [f"sha{i}" for i in range(500)], "message": ["Fix the parser"] * 500})
+    fast, small = str(tmp_path / "fast.csv.gz"), str(tmp_path / "small.csv.gz")
+    _write_frame(df, fast)
+    _write_frame(df, small, compress_level=9)
+    # The gzip header records the requested level (XFL: 4 = fastest, 2 = best)
+    assert open(fast, "rb").read()[8] == 4
+    assert open(small, "rb").read()[8] == 2
+    assert gzip.decompress(open(fast, "rb").read()) == gzip.decompress(open(small, "rb").read())
+    pd.testing.assert_frame_equal(_read_frame(fast, []), df)
+
+
+def test_merge_and_summarize_coerces_non_datetime_columns(capsys):
+    # Frames that did not come through _read_frame: strings, None and junk
+    commits = pd.DataFrame({"author": ["Alice"], "date": ["2025-09-20T12:00:00+00:00"]})
+    issues = pd.DataFrame({
+        "state": ["closed", "closed", "open"],
+        "created_at": ["2025-09-01T00:00:00+00:00", "not a date", "2025-09-02T00:00:00Z"],
+        "closed_at": ["2025-09-03T12:00:00+00:00", "2025-09-04T00:00:00+00:00", None],
+    })
+    merge_and_summarize(commits, issues)
+    out = capsys.readouterr().out
+    assert "Issue close rate: 0.67" in out
+    # The malformed created_at is skipped
+    assert "Avg. issue open duration: 2.50 days" in out
+
+    all_null = pd.DataFrame({"state": ["open"], "created_at": [None], "closed_at": [None]})
+    merge_and_summarize(commits, all_null)
+    assert "Avg. issue open duration: N/A" in capsys.readouterr().out
+
+
+def test_fetch_issues_cache_probes_all_states(tmp_path):
+    cache = str(tmp_path / "cache.db")
+    now = datetime(2025, 9, 20, 12, 0, 0)
+    gh_instance._repo = DummyRepo([], [DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0)])
+    assert list(fetch_issues("any/repo", state="open", cache_path=cache)["number"]) == [101]
+    # Closing an issue drops it from the open listing, so only an all-states probe sees the change
+    assert gh_instance.requester.parameters["state"] == "all"
+
+    # Unchanged: served from the JSON cache with the same dtypes
+    gh_instance._repo = DummyRepo([], [])
+    df = fetch_issues("any/repo", state="open", cache_path=cache)
+    assert list(df["number"]) == [101]
+    assert df.loc[0, "created_at"] == pd.Timestamp(now, tz="UTC")
+    assert pd.isna(df.loc[0, "closed_at"])
+    assert isinstance(df["state"].dtype, pd.CategoricalDtype)
+
+    gh_instance.requester.etag = "v2"
+    gh_instance._repo = DummyRepo([], [DummyIssue(1, 101, "Issue A", "alice", "closed", now, now, 0)])
+    assert fetch_issues("any/repo", state="open", cache_path=cache).empty
+
+
+@pytest.mark.parametrize("writer", ["pyarrow", "pandas"])
+def test_write_csv_iso_dates(tmp_path, monkeypatch, writer):
+    import src.repo_miner as rm
+    if writer == "pyarrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(rm, "pa_csv", None)
+    now = datetime(2025, 9, 19, 12, 0, 0)
+    gh_instance._repo = DummyRepo([], [DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0)])
+    path = str(tmp_path / "issues.csv")
+    _write_frame(fetch_issues("any/repo"), path)
+    row = open(path).read().splitlines()[1]
+    # Same format as the streaming writer and the README: ISO-8601, empty when missing
+    assert row.replace('"', "").endswith(",2025-09-19T12:00:00+00:00,,0")
+
+
+def test_stream_csv_failure_keeps_existing_output(tmp_path):
+    import src.repo_miner as rm
+    out = tmp_path / "commits.csv"
+    out.write_text("sha\nold\n")
+
+    def failing_rows():
+        yield ("sha1", "Alice", "a@example.com", datetime(2025, 9, 20), "First")
+        raise RuntimeError("network down")
+
+    with pytest.raises(RuntimeError):
+        rm._stream_csv(failing_rows(), ["sha", "author", "email", "date", "message"], str(out))
+    assert out.read_text() == "sha\nold\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["commits.csv"]
+
+
+def test_write_csv_dates_match_between_writers(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    import src.repo_miner as rm
+    df = pd.DataFrame({
+        "aware": pd.to_datetime(["2025-09-19T14:00:00+02:00", None], utc=True).tz_convert("Europe/Paris"),
+        "naive": pd.to_datetime(["2025-09-19 12:00:00", None]),
+    })
+    fast, slow = str(tmp_path / "fast.csv"), str(tmp_path / "slow.csv")
+    _write_frame(df, fast)
+    monkeypatch.setattr(rm, "pa_csv", None)
+    _write_frame(df, slow)
+    read = lambda path: pd.read_csv(path, dtype=str, keep_default_na=False)
+    # Only quoting differs; the date values are identical
+    pd.testing.assert_frame_equal(read(fast), read(slow))
+    assert list(read(fast).iloc[0]) == ["2025-09-19T12:00:00+00:00", "2025-09-19T12:00:00"]